@@ -13,10 +13,8 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 # from datetime import datetime
 import pytz
+from scoring import cont_list, Friday, contest_index, score_friday, score_daily, apply_friday, apply_daily, dumps_users
 lock = threading.Lock()
-cont_list = [1001,1002,1003,1004,1005,1006,1007,1009,1010,1011,1012]
-Friday = [1008]
-problem = ['A','B','C','D','E','F']
 class JSONDataManager:
     def __init__(self, data_file: str = "data/leaderboard.json"):
         self.data_file = data_file
@@ -69,7 +67,7 @@ class JSONDataManager:
                     os.rename(self.data_file,"data/leaderboard" + str(datetime.date.today()) + ".json" )
 
                 async with aiofiles.open(self.data_file, 'w', encoding='utf-8') as f:
-                    await f.write(json.dumps(data, ensure_ascii=False, indent=2))
+                    await f.write(dumps_users(data))
                 return True
             except Exception as e:
                 print(f"写入数据失败: {e}")
@@ -77,157 +75,25 @@ class JSONDataManager:
     
 
     async def Load_Contest_Source(self,users):
-        for user in users:
-            user['contestsocre'] = 0
+        contests = []
         for tid in Friday:
-            info = get_info(tid)
-            for role in info:
-                fenshu = 0
-                for pb in problem:
-                    if (role[pb] != "" and role[pb] != "-"):
-                        fenshu += 5
-                ok = 0
-                for user in users:
-                    if user['id'] == role['用户']:
-                        ok = 1
-                        user['contestsocre'] += fenshu
-                        break;
-                if ok == 0:
-                    user = {
-                        "id":role['用户'],
-                        "name":role['昵称'],
-                        "score": 0,
-                        "trend": 'up',
-                        "contestsocre":fenshu,
-                        "ishaveseven":False,
-                        "basescore":0,
-                        "DayInfo":"",
-                        "rank":-1
-                    }
-                    users.append(user)
-        
+            contests.append(score_friday(get_info(tid)))
+        apply_friday(users, contests)
 
 
     async def update_data(self):
-        # 将字符串转换为datetime对象
-        # contest_list = [(1001,0),(1002,0),(1003,0),(1004,0),(1005,0),(1006,0),(1007,0),(1008,0)]
-        d1 = datetime.datetime.strptime('2025-08-23', '%Y-%m-%d')
-        d2 = datetime.datetime.strptime(str(datetime.date.today()), '%Y-%m-%d')
+        # 按日期找到今天要结算的比赛
+        delta = contest_index(datetime.date.today())
         print(str(datetime.date.today()))
-        # 计算两个日期之间的差值
-        delta = int(str(d2 - d1).split()[0]) - 1
-        # print(delta)
         users = []
         if os.path.exists(self.data_file):
             users = await self.read_data()
         await self.Load_Contest_Source(users)
         uid = cont_list[delta]
-        # print(user)
-        # print(uid)
         info = get_info(uid)
-        # print(info)
         if uid not in Friday:
-            At = ""
-            Bt = ""
-            Ct = ""
             print(uid)
-            for role in info:
-                if (role['A'] != "" and role['A'] != "-" and At == "") or (role['A'] != "" and role['A'] != "-" and At > role['A']):
-                    At = role['A']
-                if (role['B'] != "" and role['B'] != "-" and Bt == "") or (role['B'] != "" and role['B'] != "-" and Bt > role['B']):
-                    Bt = role['B']
-                if (role['C'] != "" and role['C'] != "-" and Ct == "") or (role['C'] != "" and role['C'] != "-" and Ct >  role['C']):
-                    # print(role)
-                    Ct = role['C']
-            print(At)
-            print(Bt)
-            print(Ct)
-            for role in info:
-                
-                
-                fenshu = 0
-                ok = 0
-                tishu = 0
-                if role['A'] == '-':
-                    fenshu += 1
-                elif role['A'] != "":
-                    fenshu += 5
-                    tishu += 1
-
-                if role['A'] == At:
-                    fenshu += 5
-
-                if role['B'] == '-':
-                    fenshu += 1
-                elif role['B'] != "":
-                    fenshu += 5
-                    tishu += 1
-                if role['B'] == Bt:
-                    fenshu += 5
-
-                if role['C'] == '-':
-                    fenshu += 1
-                elif role['C'] != "":
-                    fenshu += 10
-                    tishu += 1
-                if role['C'] == Ct:
-                    fenshu += 5    
-            
-                for user in users:
-                    if user['id'] == role['用户']:
-                        ok = 1
-                        user['basescore'] += fenshu
-                        if tishu == 3:
-                            user['DayInfo'] += '1'
-                        else:
-                            user['DayInfo'] += '0'
-                        break;
-                if ok == 0:
-                    user = {
-                        "id":role['用户'],
-                        "name":role['昵称'],
-                        "score": 0,
-                        "trend": 'up',
-                        "contestsocre":0,
-                        "ishaveseven":False,
-                        "basescore":0,
-                        "DayInfo":"",
-                        "rank":-1
-                    }
-                    user['basescore'] = fenshu
-                    if tishu == 3:
-                        user['DayInfo'] = '1'
-                    else :
-                        user['DayInfo'] = '0'
-                    users.append(user)
-            for user in users:
-                user['score'] = user['contestsocre'] + user['basescore']
-                if user['ishaveseven'] == True:
-                    user['score'] += 20
-                # print(user) 
-                elif len(user['DayInfo'])>=7 and str(user['DayInfo']).find("1111111") != -1:
-                    user['ishaveseven'] = True
-                    user['score'] += 20
-            users.sort(key=lambda x: x['score'], reverse=True)
-            idx = 0
-            pre = 0
-            prerank = 0
-            for i, user in enumerate(users):
-                idx += 1
-                prefab = int(user['rank'])
-                if user['score'] == pre:
-                    user['rank'] = prerank   
-                else :
-                    user['rank'] = idx
-                pre = user['score']
-                prerank = user['rank']
-                if prefab > user['rank']:
-                    user['trend'] = 'up'
-                elif prefab < user['rank']:
-                    user['trend'] = 'down'
-                else:
-                    user['trend'] = 'neutral'
-            
+            apply_daily(users, score_daily(info))
             await self.write_data(users)
             return
         else:
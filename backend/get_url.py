@@ -2,9 +2,32 @@ import requests
 from bs4 import BeautifulSoup
 import re
 import time
+import datetime
 import json
 from typing import List, Dict, Any
 from collections import defaultdict
+from pathlib import Path
+
+contest_url_prefix = "http://106.13.45.150/contestrank.php?cid="
+# 榜单页面缓存目录，按爬取日期分目录保存: data/pages/<日期>/<比赛ID>.html
+# 周五赛每天都会重新爬取，每天的副本都要保留，重建时才能还原当天的状态
+page_dir = Path("data/pages")
+
+
+def save_rank_page(cid, html: str, day: datetime.date = None, directory: Path = page_dir):
+    """把榜单页面原文保存到当天的缓存目录"""
+    if day is None:
+        day = datetime.date.today()
+    directory = Path(directory) / str(day)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{cid}.html").write_text(html, encoding='utf-8')
+
+
+def load_rank_page(cid, day: datetime.date, directory: Path = page_dir) -> str:
+    """读取某天缓存的榜单页面，不存在时抛出 FileNotFoundError"""
+    return (Path(directory) / str(day) / f"{cid}.html").read_text(encoding='utf-8')
+
+
 def advanced_acm_scraper_to_dict(contest_url: str) -> Dict[str, Any]:
     """
     高级版ACM竞赛榜单爬虫，返回结构化的字典数据
@@ -48,80 +71,94 @@ def advanced_acm_scraper_to_dict(contest_url: str) -> Dict[str, Any]:
         response = requests.get(contest_url, headers=headers, timeout=10)
         response.raise_for_status()
         response.encoding = 'utf-8'
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 查找排名表格
-        table = soup.find('table', {'id': 'rank-table'})
-        if not table:
-            tables = soup.find_all('table')
-            table = tables[0] if tables else None
-        
-        if not table:
-            raise Exception("无法找到排名表格")
-        
-            # 查找表头行
-        header_row = table.find('thead').find('tr') if table.find('thead') else table.find('tr')
-        
-        # 提取表头文本
-        headers = []
-        if header_row:
-            # 提取所有<th>元素
-            td_headers = [td.text.strip() for td in header_row.find_all('td')]
-            th_headers = [th.text.strip() for th in header_row.find_all('th')]
-            # 提取所有<td>元素（如果存在）
-            # 合并结果
-            headers = td_headers + th_headers
-            # 清理多余空格
-            headers = [re.sub(r'\s+', ' ', h) for h in headers]
-        print(headers)
-        # 构建结果字典
-        result = {
-            "contest_info": {
-                "url": contest_url,
-                "scrape_time": time.strftime('%Y-%m-%d %H:%M:%S')
-            },
-            "headers": headers,
-            "teams": [],
-            "statistics": defaultdict(int)
-        }
-        
-        # 提取CID
-        cid_match = re.search(r'cid=(\d+)', contest_url)
-        if cid_match:
-            result["contest_info"]["cid"] = cid_match.group(1)
-        
-        # 处理数据行
-        rows = table.find('tbody').find_all('tr') if table.find('tbody') else table.find_all('tr')[1:]
-        
-        for row in rows:
-            cells = [td.text.strip() for td in row.find_all('td')]
-            cells = [re.sub(r'\s+', ' ', cell) for cell in cells]
-            
-            if not any(cells):
-                continue
-            
-            # 创建队伍字典
-            team_dict = {}
-            for i, header in enumerate(headers):
-                if i < len(cells):
-                    team_dict[header] = cells[i]
-                else:
-                    team_dict[header] = ""
-            
-            # 添加到结果中
-            result["teams"].append(team_dict)
-        
-        # 计算统计信息
-        result["statistics"]["total_teams"] = len(result["teams"])
-        
-        
-        return result
-        
+
+        result = parse_rank_page(response.text, contest_url)
+        print(result["headers"])
     except Exception as e:
         print(f"爬取失败: {str(e)}")
         return {"error": str(e)}
 
+    # 缓存原始榜单页面，供 replay.py 离线重建赛季数据；缓存失败不影响当天的更新
+    try:
+        if "cid" in result["contest_info"]:
+            save_rank_page(result["contest_info"]["cid"], response.text)
+    except Exception as e:
+        print(f"缓存榜单页面失败: {str(e)}")
+    return result
+
+
+def parse_rank_page(html: str, contest_url: str) -> Dict[str, Any]:
+    """
+    解析榜单页面HTML，返回格式与 advanced_acm_scraper_to_dict 相同（不访问网络）
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # 查找排名表格
+    table = soup.find('table', {'id': 'rank-table'})
+    if not table:
+        tables = soup.find_all('table')
+        table = tables[0] if tables else None
+    
+    if not table:
+        raise Exception("无法找到排名表格")
+    
+        # 查找表头行
+    header_row = table.find('thead').find('tr') if table.find('thead') else table.find('tr')
+    
+    # 提取表头文本
+    headers = []
+    if header_row:
+        # 提取所有<th>元素
+        td_headers = [td.text.strip() for td in header_row.find_all('td')]
+        th_headers = [th.text.strip() for th in header_row.find_all('th')]
+        # 提取所有<td>元素（如果存在）
+        # 合并结果
+        headers = td_headers + th_headers
+        # 清理多余空格
+        headers = [re.sub(r'\s+', ' ', h) for h in headers]
+    # 构建结果字典
+    result = {
+        "contest_info": {
+            "url": contest_url,
+            "scrape_time": time.strftime('%Y-%m-%d %H:%M:%S')
+        },
+        "headers": headers,
+        "teams": [],
+        "statistics": defaultdict(int)
+    }
+    
+    # 提取CID
+    cid_match = re.search(r'cid=(\d+)', contest_url)
+    if cid_match:
+        result["contest_info"]["cid"] = cid_match.group(1)
+    
+    # 处理数据行
+    rows = table.find('tbody').find_all('tr') if table.find('tbody') else table.find_all('tr')[1:]
+    
+    for row in rows:
+        cells = [td.text.strip() for td in row.find_all('td')]
+        cells = [re.sub(r'\s+', ' ', cell) for cell in cells]
+        
+        if not any(cells):
+            continue
+        
+        # 创建队伍字典
+        team_dict = {}
+        for i, header in enumerate(headers):
+            if i < len(cells):
+                team_dict[header] = cells[i]
+            else:
+                team_dict[header] = ""
+        
+        # 添加到结果中
+        result["teams"].append(team_dict)
+    
+    # 计算统计信息
+    result["statistics"]["total_teams"] = len(result["teams"])
+    
+    
+    return result
+
 
 
 zmb = ['A','B','C']
@@ -158,9 +195,17 @@ def process_team_data(team_dict: Dict[str, Any],result_list) -> Dict[str, Any]:
     
     # return processed
 
+def parse_info(html: str, id: int) -> List[Dict[str, Any]]:
+    """从榜单页面HTML中解析出与 get_info 相同的结果（离线使用）"""
+    result_list = []
+    contest_data = parse_rank_page(html, contest_url_prefix + str(id))
+    for team in contest_data['teams']:
+        process_team_data(team, result_list)
+    return result_list
+
 # 使用示例
 def get_info(id:int):
-    contest_url = "http://106.13.45.150/contestrank.php?cid="
+    contest_url = contest_url_prefix
     contest_url += str(id)
     result_list = []
     # 使用高级版爬虫
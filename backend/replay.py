@@ -0,0 +1,145 @@
+"""
+离线重建赛季榜单
+
+根据 cont_list 和 data/pages/<日期>/ 中每天缓存的榜单页面，从第一天开始按日期顺序重新结算，
+得到与定时任务完全一致的 leaderboard.json，不访问网络。
+
+用法（在 backend 目录下运行）:
+    python replay.py                                  # 重建到最近一次定时任务，并与 data/leaderboard.json 逐字节比对
+    python replay.py --date 2025-08-29                # 重建到指定日期
+    python replay.py --output data/leaderboard.json   # 比对后写出重建结果（用于修复坏数据）
+"""
+import sys
+import json
+import argparse
+import datetime
+import pytz
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
+
+from get_url import load_rank_page, parse_info, page_dir
+from scoring import cont_list, Friday, contest_index, score_friday, score_daily, apply_friday, apply_daily, dumps_users
+
+
+def load_contest(job):
+    """进程池任务：读取并解析某天缓存的一场比赛页面，返回 (日期, 比赛ID, 计分结果)，页面不存在时结果为 None"""
+    day, cid, directory = job
+    try:
+        html = load_rank_page(cid, day, directory)
+    except FileNotFoundError:
+        return day, cid, None
+    info = parse_info(html, cid)
+    if cid in Friday:
+        return day, cid, score_friday(info)
+    return day, cid, score_daily(info)
+
+
+def season_days(day: datetime.date) -> List[datetime.date]:
+    """从赛季第一天到 day 的所有结算日"""
+    last = contest_index(day)
+    return [day - datetime.timedelta(days=last - i) for i in range(last + 1)]
+
+
+def last_run_day() -> datetime.date:
+    """定时任务最近一次执行的日期（每天12:00 Asia/Shanghai）"""
+    now = datetime.datetime.now(pytz.timezone('Asia/Shanghai'))
+    if now.hour < 12:
+        return now.date() - datetime.timedelta(days=1)
+    return now.date()
+
+
+def replay(day: datetime.date, directory: Path = page_dir, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """重建截至 day 当天定时任务执行完后的榜单"""
+    if contest_index(day) < 0:
+        raise ValueError(f"{day} 赛季尚未开始")
+    days = season_days(day)
+    daily = {d: cont_list[contest_index(d)] for d in days}
+    jobs = []
+    for d in days:
+        jobs.append((d, daily[d], directory))
+        jobs.extend((d, cid, directory) for cid in Friday)
+    # 各场比赛互不依赖，并行解析和计分；合并时再按日期顺序进行
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = {(d, cid): res for d, cid, res in pool.map(load_contest, jobs)}
+
+    missing = [f"{d}/{daily[d]}" for d in days if results[(d, daily[d])] is None]
+    if missing:
+        raise FileNotFoundError(f"缺少比赛榜单缓存: {', '.join(missing)}（目录 {directory}）")
+
+    users = []
+    for d in days:
+        # 周五赛只使用当天爬取的副本，当天没有副本就不计入
+        friday = [results[(d, cid)] for cid in Friday if results[(d, cid)] is not None]
+        apply_friday(users, friday)
+        apply_daily(users, results[(d, daily[d])])
+    return users
+
+
+def report_diff(expected: str, actual: str):
+    """打印第一处不一致的用户记录"""
+    try:
+        old = json.loads(expected)
+    except json.JSONDecodeError:
+        print("目标文件不是有效的JSON")
+        return
+    new = json.loads(actual)
+    if len(old) != len(new):
+        print(f"人数不同: 目标 {len(old)}，重建 {len(new)}")
+    for i, (a, b) in enumerate(zip(old, new)):
+        if a != b:
+            print(f"第 {i + 1} 条记录不同:")
+            print(f"  目标: {json.dumps(a, ensure_ascii=False)}")
+            print(f"  重建: {json.dumps(b, ensure_ascii=False)}")
+            return
+    if len(old) == len(new):
+        print("内容相同，仅格式不同")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="从缓存的榜单页面离线重建赛季榜单")
+    parser.add_argument("--date", type=datetime.date.fromisoformat, default=None,
+                        help="重建到哪一天（YYYY-MM-DD，默认定时任务最近一次执行的日期）")
+    parser.add_argument("--pages", type=Path, default=page_dir, help="榜单页面缓存目录")
+    parser.add_argument("--workers", type=int, default=None, help="进程池大小，默认CPU核数")
+    parser.add_argument("--against", type=Path, default=Path("data/leaderboard.json"), help="逐字节比对的目标文件")
+    parser.add_argument("--no-verify", action="store_true", help="不与目标文件比对")
+    parser.add_argument("--output", type=Path, default=None, help="把重建结果写入该文件")
+    args = parser.parse_args(argv)
+    if args.date is None:
+        args.date = last_run_day()
+
+    last = contest_index(args.date)
+    if last >= len(cont_list):
+        # 赛季结束后定时任务不再更新数据，重建到最后一场即可
+        args.date -= datetime.timedelta(days=last - len(cont_list) + 1)
+    try:
+        users = replay(args.date, args.pages, args.workers)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"重建失败: {e}")
+        return 2
+    content = dumps_users(users)
+    print(f"已重建至 {args.date}，共 {len(users)} 人")
+
+    status = 0
+    if not args.no_verify:
+        if not args.against.exists():
+            print(f"目标文件 {args.against} 不存在，跳过比对")
+        else:
+            expected = args.against.read_bytes()
+            if expected == content.encode('utf-8'):
+                print(f"与 {args.against} 逐字节一致")
+            else:
+                print(f"与 {args.against} 不一致")
+                report_diff(expected.decode('utf-8', errors='replace'), content)
+                status = 1
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(content, encoding='utf-8')
+        print(f"已写入 {args.output}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
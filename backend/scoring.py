@@ -0,0 +1,159 @@
+import json
+import datetime
+from typing import List, Dict, Any, Tuple
+
+# 赛季从 2025-08-24 开始，每天一场日常赛，周五赛单独计分
+season_start = datetime.date(2025, 8, 23)
+cont_list = [1001,1002,1003,1004,1005,1006,1007,1009,1010,1011,1012]
+Friday = [1008]
+problem = ['A','B','C','D','E','F']
+
+
+def contest_index(day: datetime.date) -> int:
+    """返回某天应当结算的日常赛在 cont_list 中的下标"""
+    return (day - season_start).days - 1
+
+
+def new_user(uid: str, name: str) -> Dict[str, Any]:
+    """创建新用户记录（字段顺序与 leaderboard.json 保持一致）"""
+    return {
+        "id":uid,
+        "name":name,
+        "score": 0,
+        "trend": 'up',
+        "contestsocre":0,
+        "ishaveseven":False,
+        "basescore":0,
+        "DayInfo":"",
+        "rank":-1
+    }
+
+
+def dumps_users(users: List[Dict[str, Any]]) -> str:
+    """序列化榜单，写入 leaderboard.json 的唯一格式"""
+    return json.dumps(users, ensure_ascii=False, indent=2)
+
+
+def score_friday(info: List[Dict[str, Any]]) -> List[Tuple[str, str, int]]:
+    """周五赛计分：每道通过的题 5 分，返回 (用户, 昵称, 分数) 列表"""
+    results = []
+    for role in info:
+        fenshu = 0
+        for pb in problem:
+            if (role[pb] != "" and role[pb] != "-"):
+                fenshu += 5
+        results.append((role['用户'], role['昵称'], fenshu))
+    return results
+
+
+def score_daily(info: List[Dict[str, Any]]) -> List[Tuple[str, str, int, int]]:
+    """日常赛计分，返回 (用户, 昵称, 分数, 通过题数) 列表
+
+    只依赖单场比赛的榜单，可以在进程池中独立计算。
+    """
+    At = ""
+    Bt = ""
+    Ct = ""
+    for role in info:
+        if (role['A'] != "" and role['A'] != "-" and At == "") or (role['A'] != "" and role['A'] != "-" and At > role['A']):
+            At = role['A']
+        if (role['B'] != "" and role['B'] != "-" and Bt == "") or (role['B'] != "" and role['B'] != "-" and Bt > role['B']):
+            Bt = role['B']
+        if (role['C'] != "" and role['C'] != "-" and Ct == "") or (role['C'] != "" and role['C'] != "-" and Ct >  role['C']):
+            Ct = role['C']
+    results = []
+    for role in info:
+        fenshu = 0
+        tishu = 0
+        if role['A'] == '-':
+            fenshu += 1
+        elif role['A'] != "":
+            fenshu += 5
+            tishu += 1
+        if role['A'] == At:
+            fenshu += 5
+
+        if role['B'] == '-':
+            fenshu += 1
+        elif role['B'] != "":
+            fenshu += 5
+            tishu += 1
+        if role['B'] == Bt:
+            fenshu += 5
+
+        if role['C'] == '-':
+            fenshu += 1
+        elif role['C'] != "":
+            fenshu += 10
+            tishu += 1
+        if role['C'] == Ct:
+            fenshu += 5
+        results.append((role['用户'], role['昵称'], fenshu, tishu))
+    return results
+
+
+def apply_friday(users: List[Dict[str, Any]], contests: List[List[Tuple[str, str, int]]]):
+    """重新累计所有周五赛的得分到 contestsocre"""
+    for user in users:
+        user['contestsocre'] = 0
+    for results in contests:
+        for uid, name, fenshu in results:
+            ok = 0
+            for user in users:
+                if user['id'] == uid:
+                    ok = 1
+                    user['contestsocre'] += fenshu
+                    break
+            if ok == 0:
+                user = new_user(uid, name)
+                user['contestsocre'] = fenshu
+                users.append(user)
+
+
+def apply_daily(users: List[Dict[str, Any]], results: List[Tuple[str, str, int, int]]):
+    """把一场日常赛的结果合并进榜单，并重新计算总分、排名和趋势"""
+    for uid, name, fenshu, tishu in results:
+        ok = 0
+        for user in users:
+            if user['id'] == uid:
+                ok = 1
+                user['basescore'] += fenshu
+                if tishu == 3:
+                    user['DayInfo'] += '1'
+                else:
+                    user['DayInfo'] += '0'
+                break
+        if ok == 0:
+            user = new_user(uid, name)
+            user['basescore'] = fenshu
+            if tishu == 3:
+                user['DayInfo'] = '1'
+            else :
+                user['DayInfo'] = '0'
+            users.append(user)
+    for user in users:
+        user['score'] = user['contestsocre'] + user['basescore']
+        if user['ishaveseven'] == True:
+            user['score'] += 20
+        elif len(user['DayInfo'])>=7 and str(user['DayInfo']).find("1111111") != -1:
+            user['ishaveseven'] = True
+            user['score'] += 20
+    users.sort(key=lambda x: x['score'], reverse=True)
+    idx = 0
+    pre = 0
+    prerank = 0
+    for user in users:
+        idx += 1
+        prefab = int(user['rank'])
+        if user['score'] == pre:
+            user['rank'] = prerank
+        else :
+            user['rank'] = idx
+        pre = user['score']
+        prerank = user['rank']
+        if prefab > user['rank']:
+            user['trend'] = 'up'
+        elif prefab < user['rank']:
+            user['trend'] = 'down'
+        else:
+            user['trend'] = 'neutral'
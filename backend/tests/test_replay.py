@@ -0,0 +1,48 @@
+"""
+replay.py 的离线重建测试
+
+fixtures/pages 是 2025-08-24 ~ 2025-08-31 每天缓存的合成榜单页面，周五赛 1008 从 08-29 起每天一份；
+fixtures/expected/<日期>.json 是重构前的 update_data 在对应日期执行完后写出的 leaderboard.json。
+"""
+import sys
+import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from get_url import save_rank_page, load_rank_page
+from replay import replay, main
+from scoring import dumps_users
+
+fixtures = Path(__file__).resolve().parent / "fixtures"
+pages = fixtures / "pages"
+
+
+@pytest.mark.parametrize("day", ["2025-08-27", "2025-08-30", "2025-08-31"])
+def test_replay_matches_update_data(day):
+    users = replay(datetime.date.fromisoformat(day), pages, workers=2)
+    expected = (fixtures / "expected" / f"{day}.json").read_bytes()
+    assert dumps_users(users).encode('utf-8') == expected
+
+
+def test_replay_missing_daily_page(tmp_path):
+    save_rank_page(1001, (pages / "2025-08-24" / "1001.html").read_text(encoding='utf-8'),
+                   datetime.date(2025, 8, 24), tmp_path)
+    assert load_rank_page(1001, datetime.date(2025, 8, 24), tmp_path)
+    with pytest.raises(FileNotFoundError):
+        replay(datetime.date(2025, 8, 25), tmp_path, workers=1)
+
+
+def test_main_verify_and_output(tmp_path, capsys):
+    expected = fixtures / "expected" / "2025-08-31.json"
+    assert main(["--date", "2025-08-31", "--pages", str(pages), "--against", str(expected)]) == 0
+
+    # 目标文件损坏（甚至不是UTF-8）时报告不一致，并可用 --output 写出正确结果
+    broken = tmp_path / "leaderboard.json"
+    broken.write_bytes(b"\xff\xfe[")
+    assert main(["--date", "2025-08-31", "--pages", str(pages), "--against", str(broken),
+                 "--output", str(broken)]) == 1
+    assert "目标文件不是有效的JSON" in capsys.readouterr().out
+    assert broken.read_bytes() == expected.read_bytes()